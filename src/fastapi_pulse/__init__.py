@@ -11,9 +11,11 @@ from __future__ import annotations
 __version__ = "0.2.0"
 
 import importlib.resources
+import inspect
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Callable, Optional, Union
+from typing import Any, Callable, Optional, Sequence, Union
 
 from fastapi import FastAPI
 from starlette.staticfiles import StaticFiles
@@ -27,7 +29,7 @@ from .constants import (
     PULSE_STATE_KEY,
 )
 from .metrics import PulseMetrics
-from .middleware import PulseMiddleware
+from .middleware import PulseMiddleware, disable_queued_logging, enable_queued_logging
 from .payload_store import PulsePayloadStore
 from .probe import PulseProbeManager
 from .registry import PulseEndpointRegistry
@@ -35,6 +37,39 @@ from .router import create_pulse_router
 
 logger = logging.getLogger(__name__)
 
+
+def _add_lifespan_hooks(
+    app: FastAPI,
+    *,
+    on_startup: Sequence[Callable[[], Any]] = (),
+    on_shutdown: Sequence[Callable[[], Any]] = (),
+) -> None:
+    """Run pulse hooks around the application's own lifespan.
+
+    Wrapping ``app.router.lifespan_context`` covers apps built with
+    ``lifespan=`` as well as ``on_event`` handlers; ``add_event_handler``
+    hooks are silently skipped for the former.
+    """
+    app_lifespan = app.router.lifespan_context
+
+    async def run(hooks: Sequence[Callable[[], Any]]) -> None:
+        for hook in hooks:
+            result = hook()
+            if inspect.isawaitable(result):
+                await result
+
+    @asynccontextmanager
+    async def lifespan(lifespan_app: Any):
+        await run(on_startup)
+        try:
+            async with app_lifespan(lifespan_app) as state:
+                yield state
+        finally:
+            await run(on_shutdown)
+
+    app.router.lifespan_context = lifespan
+
+
 def add_pulse(
     app: FastAPI,
     enable_detailed_logging: bool = True,
@@ -43,6 +78,8 @@ def add_pulse(
     metrics: Optional[PulseMetrics] = None,
     metrics_factory: Optional[Callable[[], PulseMetrics]] = None,
     payload_config_path: Optional[Union[Path, str]] = None,
+    enable_background_logging: bool = False,
+    include_legacy_sla_strings: bool = True,
 ):
     """
     Adds pulse monitoring to your FastAPI app with one line of code.
@@ -52,6 +89,16 @@ def add_pulse(
         enable_detailed_logging: If True, logs slow requests and errors.
         dashboard_path: The path where the pulse dashboard will be served.
         enable_cors: If True, adds CORS middleware for dashboard access.
+        enable_background_logging: If True, middleware log records are handed to
+            a background QueueListener between application startup and shutdown,
+            keeping slow handlers off the event loop. While active, the
+            ``fastapi_pulse.middleware`` logger stops propagating and its records
+            are re-dispatched to the parent logger on the listener thread, so
+            they are handled slightly later and on another thread.
+        include_legacy_sla_strings: If True, /health/pulse also returns the
+            pre-formatted ``sla_compliance.details`` strings. Deprecated: the
+            default will flip to False in the next release; pass False to
+            drop them now.
     """
     if metrics is not None and metrics_factory is not None:
         raise ValueError("Provide either 'metrics' or 'metrics_factory', not both.")
@@ -98,6 +145,7 @@ def add_pulse(
         payload_store=payload_store,
     )
     setattr(app.state, PULSE_PROBE_MANAGER_KEY, probe_manager)
+    _add_lifespan_hooks(app, on_shutdown=[probe_manager.aclose])
 
     # 4. Add the pulse middleware
     app.add_middleware(
@@ -107,8 +155,24 @@ def add_pulse(
         exclude_path_prefixes=exclude_prefixes,
     )
 
+    if enable_background_logging:
+        _add_lifespan_hooks(
+            app,
+            on_startup=[enable_queued_logging],
+            on_shutdown=[disable_queued_logging],
+        )
+
     # 5. Include the pulse router bound to this metrics instance
-    app.include_router(create_pulse_router(metrics_instance), include_in_schema=False)
+    app.include_router(
+        create_pulse_router(
+            metrics_instance,
+            registry=registry,
+            manager=probe_manager,
+            payload_store=payload_store,
+            include_legacy_sla_strings=include_legacy_sla_strings,
+        ),
+        include_in_schema=False,
+    )
 
     # 6. Mount the static dashboard, finding its path within the package
     try:
@@ -1,5 +1,7 @@
 """Shared constants for Pulse state keys."""
 
+import sys
+
 PULSE_STATE_KEY = "fastapi_pulse_metrics"
 PULSE_ENDPOINT_REGISTRY_KEY = "fastapi_pulse_endpoint_registry"
 PULSE_PROBE_MANAGER_KEY = "fastapi_pulse_probe_manager"
@@ -7,6 +9,9 @@ PULSE_PAYLOAD_STORE_KEY = "fastapi_pulse_payload_store"
 
 DEFAULT_PAYLOAD_CONFIG_FILENAME = "pulse_probes.json"
 
+# ``@dataclass(slots=True)`` is only available on Python 3.10+.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 __all__ = [
     "PULSE_STATE_KEY",
@@ -14,4 +19,5 @@ __all__ = [
     "PULSE_PROBE_MANAGER_KEY",
     "PULSE_PAYLOAD_STORE_KEY",
     "DEFAULT_PAYLOAD_CONFIG_FILENAME",
+    "DATACLASS_SLOTS",
 ]
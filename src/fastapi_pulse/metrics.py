@@ -5,38 +5,65 @@ from __future__ import annotations
 import threading
 import time
 import math
+import warnings
 from collections import defaultdict, deque
-from dataclasses import dataclass
-from typing import Dict, Any, Deque, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Any, Deque, Mapping, Optional, Tuple
 
-from tdigest import TDigest
+# Log-scale histogram layout: 50 buckets per decade from 1µs to 1000s keeps
+# the relative error of any reported percentile under ~2.5%. Counts are stored
+# sparsely, so memory is bounded by the occupied buckets, never more than
+# HISTOGRAM_BUCKET_COUNT per time bucket.
+HISTOGRAM_MIN_MS = 1e-3
+HISTOGRAM_BUCKETS_PER_DECADE = 50
+HISTOGRAM_DECADES = 9
+HISTOGRAM_BUCKET_COUNT = HISTOGRAM_BUCKETS_PER_DECADE * HISTOGRAM_DECADES
+_HISTOGRAM_LOG_OFFSET = -math.log10(HISTOGRAM_MIN_MS)
+
+
+def _bucket_index(value: float) -> int:
+    """Return the histogram bucket holding *value* (milliseconds)."""
+    if value <= HISTOGRAM_MIN_MS:
+        return 0
+    index = int((math.log10(value) + _HISTOGRAM_LOG_OFFSET) * HISTOGRAM_BUCKETS_PER_DECADE)
+    return min(HISTOGRAM_BUCKET_COUNT - 1, index)
+
+
+def _bucket_value(index: int) -> float:
+    """Return the representative (geometric midpoint) value of a bucket."""
+    return 10 ** ((index + 0.5) / HISTOGRAM_BUCKETS_PER_DECADE - _HISTOGRAM_LOG_OFFSET)
 
 
 @dataclass
-class _DigestBucket:
-    """Container for digest data within a fixed time bucket."""
+class _HistogramBucket:
+    """Container for histogram data within a fixed time bucket."""
 
     start: float
-    digest: TDigest
+    counts: Dict[int, int] = field(default_factory=dict)
     count: int = 0
     total: float = 0.0
 
 
-class RollingWindowDigest:
-    """Maintain TDigest statistics over a sliding time window."""
+class RollingWindowHistogram:
+    """Maintain log-bucketed latency histograms over a sliding time window.
+
+    Each time bucket keeps its own sparse ``index -> count`` histogram and a
+    window-wide aggregate is kept in sync on add/trim, so recording is O(1)
+    and a percentile read scans only the occupied buckets. Endpoints that see
+    a handful of requests (404 scans, unique slugs) stay a few hundred bytes.
+    """
 
     def __init__(
         self,
         window_seconds: int = 300,
         bucket_seconds: int = 60,
-        delta: float = 0.01,
-        K: int = 25,
     ) -> None:
         self.window_seconds = window_seconds
         self.bucket_seconds = max(1, bucket_seconds)
-        self.delta = delta
-        self.K = K
-        self._buckets: Deque[_DigestBucket] = deque()
+        self._buckets: Deque[_HistogramBucket] = deque()
+        self._aggregate: Dict[int, int] = {}
+        self._count = 0
+        self._total = 0.0
 
     def add(self, value: float, timestamp: Optional[float] = None) -> None:
         """Add a latency sample into the rolling window."""
@@ -48,62 +75,102 @@ class RollingWindowDigest:
         if self._buckets and self._buckets[-1].start == bucket_start:
             bucket = self._buckets[-1]
         else:
-            bucket = _DigestBucket(
-                start=bucket_start,
-                digest=TDigest(delta=self.delta, K=self.K),
-            )
+            bucket = _HistogramBucket(start=bucket_start)
             self._buckets.append(bucket)
 
-        bucket.digest.update(value)
+        index = _bucket_index(value)
+        counts = bucket.counts
+        counts[index] = counts.get(index, 0) + 1
         bucket.count += 1
         bucket.total += value
+        aggregate = self._aggregate
+        aggregate[index] = aggregate.get(index, 0) + 1
+        self._count += 1
+        self._total += value
 
     def count(self) -> int:
         self._refresh()
-        return sum(bucket.count for bucket in self._buckets)
+        return self._count
 
     def total(self) -> float:
         self._refresh()
-        return sum(bucket.total for bucket in self._buckets)
+        return self._total
 
     def mean(self) -> float:
         self._refresh()
-        total = 0.0
-        count = 0
-        for bucket in self._buckets:
-            total += bucket.total
-            count += bucket.count
-        if count == 0:
+        if self._count == 0:
             return 0.0
-        return total / count
+        return self._total / self._count
 
     def percentile(self, percentile: float) -> Optional[float]:
         """Return the requested percentile (0-100) if enough data exists."""
         self._refresh()
-        merged = TDigest(delta=self.delta, K=self.K)
-        total_count = 0
-        for bucket in self._buckets:
-            merged = merged + bucket.digest
-            total_count += bucket.count
-
+        total_count = self._count
         if total_count < 2:
             return None
 
-        if merged.n < 2:
-            return None
-
-        merged.compress()
-        return float(merged.percentile(percentile))
+        # Interpolate between the two closest ranks, matching numpy's
+        # "linear" method on the bucket representative values.
+        position = (percentile / 100.0) * (total_count - 1)
+        lower_rank = int(position)
+        upper_rank = min(lower_rank + 1, total_count - 1)
+        fraction = position - lower_rank
+
+        lower_value: Optional[float] = None
+        seen = 0
+        aggregate = self._aggregate
+        for index in sorted(aggregate):
+            seen += aggregate[index]
+            if lower_value is None and seen > lower_rank:
+                lower_value = _bucket_value(index)
+            if seen > upper_rank:
+                upper_value = _bucket_value(index)
+                return lower_value + (upper_value - lower_value) * fraction
+
+        return None
 
     def _trim(self, now: float) -> None:
         cutoff = now - self.window_seconds
         while self._buckets and self._buckets[0].start < cutoff:
-            self._buckets.popleft()
+            expired = self._buckets.popleft()
+            aggregate = self._aggregate
+            for index, bucket_count in expired.counts.items():
+                remaining = aggregate[index] - bucket_count
+                if remaining:
+                    aggregate[index] = remaining
+                else:
+                    del aggregate[index]
+            self._count -= expired.count
+            self._total -= expired.total
+        if not self._buckets:
+            self._total = 0.0
 
     def _refresh(self) -> None:
         self._trim(time.time())
 
 
+class RollingWindowDigest(RollingWindowHistogram):
+    """Deprecated alias of :class:`RollingWindowHistogram`.
+
+    Kept for code written against the TDigest-backed tracker; ``delta`` and
+    ``K`` are accepted for signature compatibility and ignored.
+    """
+
+    def __init__(
+        self,
+        window_seconds: int = 300,
+        bucket_seconds: int = 60,
+        delta: float = 0.01,
+        K: int = 25,
+    ) -> None:
+        warnings.warn(
+            "RollingWindowDigest is deprecated; use RollingWindowHistogram instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        super().__init__(window_seconds=window_seconds, bucket_seconds=bucket_seconds)
+
+
 class PulseMetrics:
     """Thread-safe performance metrics collector."""
 
@@ -117,17 +184,19 @@ class PulseMetrics:
         # rolling window configuration.
         self.max_samples = max_samples
         self._lock = threading.Lock()
+        # Bumped on every recorded request so readers can cache derived views.
+        self.version = 0
 
         self.window_seconds = window_seconds
         self.bucket_seconds = bucket_seconds
 
         self._latency_trackers = defaultdict(
-            lambda: RollingWindowDigest(
+            lambda: RollingWindowHistogram(
                 window_seconds=self.window_seconds,
                 bucket_seconds=self.bucket_seconds,
             )
         )
-        self._global_latency = RollingWindowDigest(
+        self._global_latency = RollingWindowHistogram(
             window_seconds=self.window_seconds,
             bucket_seconds=self.bucket_seconds,
         )
@@ -137,8 +206,9 @@ class PulseMetrics:
         self.error_counts = defaultdict(int)
         self.status_codes = defaultdict(lambda: defaultdict(int))
 
-        # Business metrics
-        self.endpoint_metrics = defaultdict(
+        # Business metrics; latency fields are only current inside snapshots,
+        # read them through ``endpoint_metrics`` or ``get_metrics()``.
+        self._endpoint_rows = defaultdict(
             lambda: {
                 "total_requests": 0,
                 "success_count": 0,
@@ -149,15 +219,24 @@ class PulseMetrics:
                 "window_seconds": self.window_seconds,
             }
         )
+        # Endpoint rows with latency stats filled in, memoized by snapshot_key().
+        self._endpoint_metrics_cache: Optional[Tuple[Tuple[int, int], Dict[str, Dict[str, Any]]]] = None
+
     def record_request(self, 
                       endpoint: str, 
                       method: str, 
                       status_code: int, 
                       duration_ms: float,
-                      correlation_id: str = None):
-        """Record a request's performance metrics."""
+                      correlation_id: str = None,
+                      endpoint_key: Optional[str] = None):
+        """Record a request's performance metrics.
+
+        ``endpoint_key`` may be passed when the caller already built the
+        ``"METHOD /path"`` key, avoiding a second string allocation.
+        """
         with self._lock:
-            key = f"{method} {endpoint}"
+            key = endpoint_key if endpoint_key is not None else f"{method} {endpoint}"
+            self.version += 1
             
             # Basic counters
             self.request_counts[key] += 1
@@ -173,24 +252,14 @@ class PulseMetrics:
                 self.error_counts[key] += 1
             
             # Update endpoint metrics
-            metrics = self.endpoint_metrics[key]
+            metrics = self._endpoint_rows[key]
             metrics["total_requests"] += 1
             
             if status_code < 400:
                 metrics["success_count"] += 1
             else:
                 metrics["error_count"] += 1
-            
-            # Calculate stats
-            metrics["avg_response_time"] = tracker.mean()
-
-            p95 = tracker.percentile(95)
-            p99 = tracker.percentile(99)
-
-            if p95 is not None:
-                metrics["p95_response_time"] = p95
-            if p99 is not None:
-                metrics["p99_response_time"] = p99
+            # Latency stats are derived lazily in _endpoint_metrics_snapshot().
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get current performance metrics."""
@@ -198,7 +267,7 @@ class PulseMetrics:
             return {
                 "request_counts": dict(self.request_counts),
                 "error_counts": dict(self.error_counts),
-                "endpoint_metrics": dict(self.endpoint_metrics),
+                "endpoint_metrics": self._copy_endpoint_metrics(),
                 "status_codes": {
                     endpoint: dict(status_counts)
                     for endpoint, status_counts in self.status_codes.items()
@@ -206,6 +275,75 @@ class PulseMetrics:
                 "summary": self._calculate_summary()
             }
 
+    @property
+    def endpoint_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint counters and current latency stats, as a detached copy."""
+        with self._lock:
+            return self._copy_endpoint_metrics()
+
+    def _copy_endpoint_metrics(self) -> Dict[str, Dict[str, Any]]:
+        # Callers get their own row dicts so they cannot corrupt the memoized snapshot.
+        return {key: dict(row) for key, row in self._endpoint_metrics_snapshot().items()}
+
+    def endpoint_rows_snapshot(self) -> Mapping[str, Mapping[str, Any]]:
+        """Return the memoized ``key -> row`` endpoint metrics without copying.
+
+        The mapping and its rows are shared with later callers and must be
+        treated as read-only; a new snapshot replaces them rather than
+        mutating them, so they can be iterated after the lock is released.
+        """
+        with self._lock:
+            return self._endpoint_metrics_snapshot()
+
+    def snapshot_key(self) -> Tuple[int, int]:
+        """Return a key that changes whenever ``get_metrics()`` output may change.
+
+        The output changes when a request is recorded (``version``) or when a
+        time bucket ages out of the rolling window, which can only happen when
+        ``now - window_seconds`` crosses a bucket boundary.
+        """
+        window_epoch = math.floor(
+            (time.time() - self.window_seconds) / max(1, self.bucket_seconds)
+        )
+        return self.version, window_epoch
+
+    def get_endpoint_percentile(self, endpoint_key: str, percentile: float) -> Optional[float]:
+        """Return a latency percentile for ``"METHOD /path"`` without building a full snapshot."""
+        with self._lock:
+            tracker = self._latency_trackers.get(endpoint_key)
+            if tracker is None:
+                return None
+            return tracker.percentile(percentile)
+
+    def _endpoint_metrics_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return endpoint rows with latency stats, recomputed only when stale.
+
+        Must be called with ``self._lock`` held. Percentiles only change when
+        a request is recorded or a bucket ages out, so repeated scrapes between
+        those events reuse the previous result.
+        """
+        key = self.snapshot_key()
+        cached = self._endpoint_metrics_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        snapshot = {}
+        for endpoint_key, metrics in self._endpoint_rows.items():
+            tracker = self._latency_trackers[endpoint_key]
+            metrics["avg_response_time"] = tracker.mean()
+
+            p95 = tracker.percentile(95)
+            p99 = tracker.percentile(99)
+
+            if p95 is not None:
+                metrics["p95_response_time"] = p95
+            if p99 is not None:
+                metrics["p99_response_time"] = p99
+            snapshot[endpoint_key] = dict(metrics)
+
+        self._endpoint_metrics_cache = (key, snapshot)
+        return snapshot
+
     def _calculate_summary(self) -> Dict[str, Any]:
         """Calculate summary metrics across all endpoints."""
         total_requests = sum(self.request_counts.values())
@@ -2,26 +2,155 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 import logging
+import queue
 import re
-from typing import Callable, Optional, Tuple
+import sys
+import threading
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, Dict, Optional, Tuple
 
-from starlette.datastructures import Headers, MutableHeaders
 from starlette.types import Message, Receive, Scope, Send
 
 from .metrics import PulseMetrics
 
 logger = logging.getLogger(__name__)
+_perf_counter = time.perf_counter
 
 SLOW_REQUEST_THRESHOLD_MS = 1000
 SLA_LATENCY_THRESHOLD_MS = 200
+SLA_CHECK_INTERVAL_SECONDS = 1.0
 DEFAULT_ERROR_BODY = b'{"detail":"Internal Server Error"}'
+_DEFAULT_ERROR_BODY_LENGTH = str(len(DEFAULT_ERROR_BODY)).encode("ascii")
+METRICS_QUEUE_MAXSIZE = 4096
+METRICS_DRAIN_BATCH_SIZE = 256
+
+# UUID and integer segments are matched in a single pass; the UUID branch is
+# tried first so digit-leading UUIDs are not split by the integer branch.
+_ID_RE = re.compile(
+    r'/(?:[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9]+)',
+    re.IGNORECASE,
+)
+_DIGITS = frozenset('0123456789')
+
+
+class _LoggerDispatchHandler(logging.Handler):
+    """Hand records to *target* so its handler chain runs on the listener thread."""
+
+    def __init__(self, target: logging.Logger) -> None:
+        super().__init__()
+        self.target = target
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.target.handle(record)
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """QueueHandler that enqueues records untouched.
+
+    The stock ``prepare`` formats the message and drops ``exc_info`` and
+    ``stack_info`` so records survive pickling; our queue never leaves the
+    process, so downstream handlers keep the original exception objects.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_queued_logging_lock = threading.Lock()
+_queued_logging_users = 0
+_queued_logging_state: Optional[Tuple[QueueHandler, QueueListener]] = None
+
+
+def enable_queued_logging() -> None:
+    """Route middleware log records through a background QueueListener.
+
+    Records are re-dispatched to the parent logger on the listener thread, so
+    handlers configured after startup (e.g. by uvicorn) still receive them.
+    Calls are reference-counted; pair each with :func:`disable_queued_logging`.
+    """
+    global _queued_logging_users, _queued_logging_state
+    with _queued_logging_lock:
+        _queued_logging_users += 1
+        if _queued_logging_state is not None:
+            return
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = _InProcessQueueHandler(log_queue)
+        listener = QueueListener(
+            log_queue,
+            _LoggerDispatchHandler(logger.parent or logging.getLogger()),
+            respect_handler_level=True,
+        )
+        listener.start()
+        logger.addHandler(queue_handler)
+        logger.propagate = False
+        _queued_logging_state = (queue_handler, listener)
+
+
+def disable_queued_logging() -> None:
+    """Release one :func:`enable_queued_logging` reference, flushing on the last."""
+    global _queued_logging_users, _queued_logging_state
+    with _queued_logging_lock:
+        if _queued_logging_users == 0:
+            return
+        _queued_logging_users -= 1
+        if _queued_logging_users or _queued_logging_state is None:
+            return
+
+        queue_handler, listener = _queued_logging_state
+        _queued_logging_state = None
+        logger.removeHandler(queue_handler)
+        logger.propagate = True
+        listener.stop()
+
+
+def _response_time_header(duration_ms: float) -> Tuple[bytes, bytes]:
+    """Build the raw ``x-response-time-ms`` header pair."""
+    return (b"x-response-time-ms", format(duration_ms, ".2f").encode("ascii"))
+
+
+def _set_response_time_header(headers: list, duration_ms: float) -> None:
+    """Set ``x-response-time-ms`` on a raw header list, replacing any app-set value."""
+    header = _response_time_header(duration_ms)
+    for index, (name, _) in enumerate(headers):
+        if name.lower() == b"x-response-time-ms":
+            headers[index] = header
+            return
+    headers.append(header)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_path_cached(path: str) -> str:
+    """Normalize path for metrics grouping, memoized per raw path."""
+    # Every identifier contains a digit or a dash (UUID); most static routes
+    # have neither and can skip the regex engine entirely.
+    if '-' not in path and _DIGITS.isdisjoint(path):
+        return path
+    return _ID_RE.sub('/{id}', path)
 
 
 class PulseMiddleware:
     """ASGI middleware that records latency, status codes, and SLA metrics."""
 
+    __slots__ = (
+        "app",
+        "enable_detailed_logging",
+        "metrics",
+        "exclude_path_prefixes",
+        "dropped_measurements",
+        "_exclude_paths",
+        "_exclude_prefixes",
+        "_sla_interval",
+        "_last_sla_check",
+        "_queue",
+        "_queue_loop",
+        "_drain_task",
+    )
+
     def __init__(
         self,
         app: Callable,
@@ -37,22 +166,47 @@ class PulseMiddleware:
             prefix if prefix.startswith('/') else f'/{prefix}'
             for prefix in (exclude_path_prefixes or ())
         )
+        # Precompute the exact paths and "<prefix>/" forms so the per-request
+        # check is a set lookup plus a single C-level startswith call.
+        normalized_prefixes = [
+            prefix.rstrip('/') or '/' for prefix in self.exclude_path_prefixes
+        ]
+        self._exclude_paths = frozenset(normalized_prefixes)
+        self._exclude_prefixes = tuple(
+            f'{prefix}/' for prefix in normalized_prefixes if prefix != '/'
+        )
+        self.dropped_measurements = 0
+        self._sla_interval = SLA_CHECK_INTERVAL_SECONDS
+        self._last_sla_check: Dict[str, float] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._queue_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._drain_task: Optional[asyncio.Task] = None
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process ASGI calls and record metrics for HTTP requests."""
-        if scope["type"] != "http":
-            await self.app(scope, receive, send)
+        app = self.app
+        scope_type = scope["type"]
+        if scope_type != "http":
+            if scope_type == "lifespan":
+                send = self._wrap_lifespan_send(send)
+            await app(scope, receive, send)
             return
 
-        headers = Headers(scope=scope)
-        correlation_id = headers.get("x-correlation-id", "unknown")
-        method = scope.get("method", "GET")
         raw_path = scope.get("path", "/")
-        skip_tracking = self._should_skip_tracking(raw_path)
-        endpoint_path = self._normalize_path(raw_path)
-        track_metrics = not skip_tracking
+        if self._should_skip_tracking(raw_path):
+            # Dashboard and pulse API traffic bypasses all instrumentation.
+            await app(scope, receive, send)
+            return
 
-        start_time = time.perf_counter()
+        correlation_id = "unknown"
+        for header_name, header_value in scope.get("headers") or ():
+            if header_name == b"x-correlation-id":
+                correlation_id = header_value.decode("latin-1")
+                break
+        method = scope.get("method", "GET")
+        endpoint_path = _normalize_path_cached(raw_path)
+
+        start_time = _perf_counter()
         status_code = 500
         duration_ms: Optional[float] = None
         response_started = False
@@ -64,11 +218,9 @@ class PulseMiddleware:
                 response_started = True
                 status_code = message["status"]
 
-                # Ensure we can mutate headers and attach latency information.
-                raw_headers = message.setdefault("headers", [])
-                headers_obj = MutableHeaders(raw=raw_headers)
+                # Attach latency information straight onto the raw header list.
                 duration_ms = self._ensure_duration(duration_ms, start_time)
-                headers_obj["X-Response-Time-Ms"] = f"{duration_ms:.2f}"
+                _set_response_time_header(message.setdefault("headers", []), duration_ms)
 
             elif message["type"] == "http.response.body":
                 duration_ms = self._ensure_duration(duration_ms, start_time)
@@ -78,7 +230,7 @@ class PulseMiddleware:
         request_failed = False
 
         try:
-            await self.app(scope, receive, send_wrapper)
+            await app(scope, receive, send_wrapper)
         except Exception:
             request_failed = True
             logger.exception(
@@ -107,37 +259,138 @@ class PulseMiddleware:
             duration_ms = self._ensure_duration(duration_ms, start_time)
             final_status = status_code if not request_failed else 500
 
-            if track_metrics:
-                self.metrics.record_request(
-                    endpoint=endpoint_path,
-                    method=method,
-                    status_code=final_status,
-                    duration_ms=duration_ms,
-                    correlation_id=correlation_id,
-                )
+            # Interned so the metrics and SLA dict lookups hit the cached hash.
+            endpoint_key = sys.intern(f"{method} {endpoint_path}")
+            self._enqueue_measurement(
+                (endpoint_key, endpoint_path, method, final_status, duration_ms, correlation_id)
+            )
 
-                if self.enable_detailed_logging and (
-                    duration_ms > SLOW_REQUEST_THRESHOLD_MS or final_status >= 400
-                ):
-                    self._log_performance_alert(
-                        method=method,
-                        path=endpoint_path,
-                        status_code=final_status,
-                        duration_ms=duration_ms,
-                        correlation_id=correlation_id,
-                    )
-
-                self._check_sla_violation(
-                    method=method,
-                    endpoint_path=endpoint_path,
-                    correlation_id=correlation_id,
+    def _enqueue_measurement(self, measurement: Tuple[str, str, str, int, float, str]) -> None:
+        """Hand a measurement to the background drain without blocking the request."""
+        try:
+            queue = self._ensure_drain_task()
+        except RuntimeError:
+            # No asyncio loop (e.g. anyio on trio): record inline as before.
+            self._record_measurement(measurement)
+            return
+        try:
+            queue.put_nowait(measurement)
+        except asyncio.QueueFull:
+            self.dropped_measurements += 1
+            dropped = self.dropped_measurements
+            # Warn on the 1st, 2nd, 4th, 8th... drop so later overflows still
+            # surface without flooding the log while the queue stays full.
+            if dropped & (dropped - 1) == 0:
+                logger.warning(
+                    "Pulse metrics queue is full; dropping measurements",
+                    extra={
+                        "queue_maxsize": METRICS_QUEUE_MAXSIZE,
+                        "dropped_measurements": dropped,
+                    },
                 )
-    
-    def _normalize_path(self, path: str) -> str:
-        """Normalize path for metrics grouping."""
-        path = re.sub(r'/[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', '/{id}', path, flags=re.IGNORECASE)
-        path = re.sub(r'/\d+', '/{id}', path)
-        return path
+
+    def _ensure_drain_task(self) -> asyncio.Queue:
+        """Start the drain task on the running loop, restarting it if the loop changed."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._queue is None
+            or self._queue_loop is not loop
+            or self._drain_task is None
+            or self._drain_task.done()
+        ):
+            self._queue = asyncio.Queue(maxsize=METRICS_QUEUE_MAXSIZE)
+            self._queue_loop = loop
+            self._drain_task = loop.create_task(self._drain(self._queue))
+        return self._queue
+
+    async def _drain(self, queue: asyncio.Queue) -> None:
+        """Record queued measurements in batches of up to METRICS_DRAIN_BATCH_SIZE."""
+        try:
+            while True:
+                batch = [await queue.get()]
+                while len(batch) < METRICS_DRAIN_BATCH_SIZE and not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                for measurement in batch:
+                    self._record_measurement(measurement)
+        finally:
+            # Cancellation only lands on ``queue.get()``; record what is left.
+            self._flush_queue(queue)
+
+    def _flush_queue(self, queue: asyncio.Queue) -> None:
+        while not queue.empty():
+            self._record_measurement(queue.get_nowait())
+
+    def _record_measurement(self, measurement: Tuple[str, str, str, int, float, str]) -> None:
+        try:
+            self._process_measurement(*measurement)
+        except Exception:
+            logger.exception("Failed to record pulse measurement")
+
+    async def aclose(self) -> None:
+        """Record every queued measurement and stop the background drain task.
+
+        Called automatically when the ASGI lifespan shuts down.
+        """
+        task, queue, loop = self._drain_task, self._queue, self._queue_loop
+        self._drain_task = self._queue = self._queue_loop = None
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if task is not None and not task.done() and loop is running_loop:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if queue is not None:
+            # Covers a task that was cancelled before it ever started running.
+            self._flush_queue(queue)
+
+    def _wrap_lifespan_send(self, send: Send) -> Send:
+        """Flush pending measurements once the application has shut down."""
+
+        async def lifespan_send(message: Message) -> None:
+            if message["type"] in ("lifespan.shutdown.complete", "lifespan.shutdown.failed"):
+                await self.aclose()
+            await send(message)
+
+        return lifespan_send
+
+    def _process_measurement(
+        self,
+        endpoint_key: str,
+        endpoint_path: str,
+        method: str,
+        status_code: int,
+        duration_ms: float,
+        correlation_id: str,
+    ) -> None:
+        self.metrics.record_request(
+            endpoint=endpoint_path,
+            method=method,
+            status_code=status_code,
+            duration_ms=duration_ms,
+            correlation_id=correlation_id,
+            endpoint_key=endpoint_key,
+        )
+
+        if self.enable_detailed_logging and (
+            duration_ms > SLOW_REQUEST_THRESHOLD_MS or status_code >= 400
+        ):
+            self._log_performance_alert(
+                method=method,
+                path=endpoint_path,
+                status_code=status_code,
+                duration_ms=duration_ms,
+                correlation_id=correlation_id,
+            )
+
+        self._check_sla_violation(
+            endpoint_key=endpoint_key,
+            correlation_id=correlation_id,
+        )
 
     def _log_performance_alert(self, method: str, path: str, status_code: int, duration_ms: float, correlation_id: str) -> None:
         log_level = (
@@ -160,48 +413,44 @@ class PulseMiddleware:
             }
         )
 
-    def _check_sla_violation(self, method: str, endpoint_path: str, correlation_id: str) -> None:
-        current_metrics = self.metrics.get_metrics()
-        endpoint_key = f"{method} {endpoint_path}"
-        
-        if endpoint_key in current_metrics["endpoint_metrics"]:
-            endpoint_stats = current_metrics["endpoint_metrics"][endpoint_key]
-            p95_time = endpoint_stats.get("p95_response_time", 0)
-            
-            if p95_time > SLA_LATENCY_THRESHOLD_MS:  # SLA violation
-                logger.warning(
-                    "SLA violation detected",
-                    extra={
-                        "correlation_id": correlation_id,
-                        "endpoint": endpoint_key,
-                        "p95_response_time": p95_time,
-                        "sla_limit": SLA_LATENCY_THRESHOLD_MS,
-                        "violation_type": "latency_sla"
-                    }
-                )
+    def _check_sla_violation(self, endpoint_key: str, correlation_id: str) -> None:
+        # Evaluate each endpoint at most once per interval; the p95 barely
+        # moves between consecutive requests and get_metrics() is not cheap.
+        now = time.monotonic()
+        last_check = self._last_sla_check.get(endpoint_key)
+        if last_check is not None and now - last_check < self._sla_interval:
+            return
+        self._last_sla_check[endpoint_key] = now
+
+        p95_time = self.metrics.get_endpoint_percentile(endpoint_key, 95)
+        if p95_time is not None and p95_time > SLA_LATENCY_THRESHOLD_MS:  # SLA violation
+            logger.warning(
+                "SLA violation detected",
+                extra={
+                    "correlation_id": correlation_id,
+                    "endpoint": endpoint_key,
+                    "p95_response_time": p95_time,
+                    "sla_limit": SLA_LATENCY_THRESHOLD_MS,
+                    "violation_type": "latency_sla"
+                }
+            )
 
     def _ensure_duration(self, cached_duration: Optional[float], start_time: float) -> float:
         """Return the cached duration if present, otherwise compute it."""
         if cached_duration is not None:
             return cached_duration
-        return (time.perf_counter() - start_time) * 1000
+        return (_perf_counter() - start_time) * 1000
 
     def _should_skip_tracking(self, path: str) -> bool:
-        for prefix in self.exclude_path_prefixes:
-            normalized = prefix.rstrip('/') or '/'
-            if path == normalized:
-                return True
-            if normalized != '/' and path.startswith(normalized + '/'):
-                return True
-        return False
+        return path in self._exclude_paths or path.startswith(self._exclude_prefixes)
 
     async def _emit_fallback_response(self, send: Send, duration_ms: float) -> None:
         """Send a JSON 500 response when the downstream app fails early."""
-        headers_list: list[tuple[bytes, bytes]] = []
-        headers_obj = MutableHeaders(raw=headers_list)
-        headers_obj["content-type"] = "application/json"
-        headers_obj["content-length"] = str(len(DEFAULT_ERROR_BODY))
-        headers_obj["X-Response-Time-Ms"] = f"{duration_ms:.2f}"
+        headers_list = [
+            (b"content-type", b"application/json"),
+            (b"content-length", _DEFAULT_ERROR_BODY_LENGTH),
+            _response_time_header(duration_ms),
+        ]
 
         await send(
             {
@@ -4,24 +4,51 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
+import math
 from copy import deepcopy
 import time
-import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from secrets import token_hex
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
+from .constants import DATACLASS_SLOTS
 from .metrics import PulseMetrics
 from .payload_store import PulsePayloadStore
 from .registry import EndpointInfo, PulseEndpointRegistry
 from .sample_builder import SamplePayloadBuilder
 
 
-ProbeResultStatus = str
-
+logger = logging.getLogger(__name__)
 
-@dataclass
+ProbeResultStatus = str
+DEFAULT_MAX_JOBS = 32
+
+
+def _format_utc_iso(timestamp: float) -> str:
+    """Render *timestamp* like ``datetime.fromtimestamp(ts, timezone.utc).isoformat()``.
+
+    Formats straight from ``time.gmtime`` so no datetime/tzinfo objects are built.
+    """
+    fraction, whole = math.modf(timestamp)
+    seconds = int(whole)
+    micros = round(fraction * 1e6)
+    if micros >= 1_000_000:
+        seconds += 1
+        micros -= 1_000_000
+    elif micros < 0:
+        seconds -= 1
+        micros += 1_000_000
+    parts = time.gmtime(seconds)[:6]
+    if micros:
+        return "%04d-%02d-%02dT%02d:%02d:%02d.%06d+00:00" % (parts + (micros,))
+    return "%04d-%02d-%02dT%02d:%02d:%02d+00:00" % parts
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ProbeResult:
     endpoint_id: str
     method: str
@@ -31,8 +58,14 @@ class ProbeResult:
     latency_ms: Optional[float] = None
     error: Optional[str] = None
     checked_at: Optional[float] = None
+    checked_at_iso: Optional[str] = None
     payload: Optional[Dict[str, Any]] = None
 
+    def mark_checked(self) -> None:
+        """Stamp the result with the current time, pre-rendering the ISO form."""
+        self.checked_at = time.time()
+        self.checked_at_iso = _format_utc_iso(self.checked_at)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "endpoint_id": self.endpoint_id,
@@ -43,11 +76,12 @@ class ProbeResult:
             "latency_ms": self.latency_ms,
             "error": self.error,
             "checked_at": self.checked_at,
+            "checked_at_iso": self.checked_at_iso,
             "payload": self.payload,
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProbeJob:
     job_id: str
     status: str = "queued"
@@ -57,9 +91,17 @@ class ProbeJob:
     completed_at: Optional[float] = None
     results: Dict[str, ProbeResult] = field(default_factory=dict)
     _future: Optional[asyncio.Future] = None
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
+    _cached_version: Tuple[int, str] = field(default=(-1, ""), repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        # Results only change as probes complete, so the serialized form is
+        # reused until the completion counter or job status moves.
+        version = (self.completed, self.status)
+        if self._cached_dict is not None and version == self._cached_version:
+            return self._cached_dict
+
+        data = {
             "job_id": self.job_id,
             "status": self.status,
             "total": self.total_targets,
@@ -68,6 +110,9 @@ class ProbeJob:
             "completed_at": self.completed_at,
             "results": {key: result.to_dict() for key, result in self.results.items()},
         }
+        self._cached_dict = data
+        self._cached_version = version
+        return data
 
 
 class PulseProbeManager:
@@ -82,20 +127,23 @@ class PulseProbeManager:
         payload_store: PulsePayloadStore,
         concurrency: int = 10,
         request_timeout: float = 10.0,
+        max_jobs: int = DEFAULT_MAX_JOBS,
     ) -> None:
         self.app = app
         self.metrics = metrics
         self.registry = registry
         self.payload_store = payload_store
-        self.semaphore = asyncio.Semaphore(max(1, concurrency))
+        self.concurrency = max(1, concurrency)
         self.request_timeout = request_timeout
-        self._jobs: Dict[str, ProbeJob] = {}
+        self.max_jobs = max(1, max_jobs)
+        self._jobs: OrderedDict[str, ProbeJob] = OrderedDict()
         self._last_job_id: Optional[str] = None
+        self._client: Optional[httpx.AsyncClient] = None
 
     def start_probe(self, endpoints: List[EndpointInfo]) -> str:
         """Start a probe job for the provided endpoints and return its identifier."""
         loop = asyncio.get_running_loop()
-        job_id = uuid.uuid4().hex
+        job_id = token_hex(16)
         job = ProbeJob(job_id=job_id)
         job.total_targets = len(endpoints)
         job._future = loop.create_future()
@@ -109,6 +157,9 @@ class PulseProbeManager:
             for endpoint in endpoints
         }
         self._jobs[job_id] = job
+        self._jobs.move_to_end(job_id)
+        while len(self._jobs) > self.max_jobs:
+            self._jobs.popitem(last=False)
         self._last_job_id = job_id
 
         loop.create_task(self._run_job(job, endpoints))
@@ -130,109 +181,141 @@ class PulseProbeManager:
             return self._jobs.get(self._last_job_id)
         return None
 
+    async def aclose(self) -> None:
+        """Close the shared probe client (wired to application shutdown)."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared in-process client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=self.app),
+                base_url="http://pulse-probe",
+                timeout=self.request_timeout,
+            )
+        return self._client
+
     async def _run_job(self, job: ProbeJob, endpoints: List[EndpointInfo]) -> None:
         job.status = "running"
         job.started_at = time.time()
 
-        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=self.app), base_url="http://pulse-probe") as client:
-            tasks = [
-                self._probe_endpoint(job, client, endpoint)
-                for endpoint in endpoints
-            ]
-            await asyncio.gather(*tasks, return_exceptions=True)
+        client = await self._get_client()
+        queue: asyncio.Queue = asyncio.Queue()
+        for endpoint in endpoints:
+            queue.put_nowait(endpoint)
+
+        # A fixed pool of workers caps in-flight probes without allocating one
+        # coroutine per endpoint up front.
+        workers = min(self.concurrency, len(endpoints))
+        await asyncio.gather(
+            *(self._worker(job, client, queue) for _ in range(workers))
+        )
 
         job.status = "completed"
         job.completed_at = time.time()
         if job._future and not job._future.done():
             job._future.set_result(job)
 
+    async def _worker(
+        self,
+        job: ProbeJob,
+        client: httpx.AsyncClient,
+        queue: asyncio.Queue,
+    ) -> None:
+        while not queue.empty():
+            endpoint = queue.get_nowait()
+            try:
+                await self._probe_endpoint(job, client, endpoint)
+            except Exception:  # pragma: no cover - defensive, keeps the worker alive
+                logger.exception("Probe failed for %s", endpoint.id)
+
     async def _probe_endpoint(
         self,
         job: ProbeJob,
         client: httpx.AsyncClient,
         endpoint: EndpointInfo,
     ) -> None:
-        async with self.semaphore:
-            result = job.results[endpoint.id]
-
-            payload = self._prepare_payload(endpoint)
-            if payload is None:
-                result.status = "skipped"
-                result.checked_at = time.time()
-                job.completed += 1
-                return
-
-            start = time.perf_counter()
-            try:
-                formatted_path = self._format_path(endpoint.path, payload.get("path_params", {}))
-                headers = {
-                    **(payload.get("headers") or {}),
-                    "x-pulse-probe": "true",
-                }
-                request_kwargs: Dict[str, Any] = {
-                    "timeout": self.request_timeout,
-                    "params": payload.get("query") or None,
-                    "headers": headers,
-                }
-
-                body = payload.get("body")
-                media_type = payload.get("media_type") or "application/json"
-                if body is not None:
-                    if isinstance(body, (dict, list)) and media_type.startswith("application/json"):
-                        request_kwargs["json"] = body
-                    else:
-                        if isinstance(body, (dict, list)):
-                            request_kwargs["data"] = json.dumps(body)
-                        else:
-                            request_kwargs["data"] = body
-                        request_kwargs.setdefault("headers", {})["content-type"] = media_type
-
-                response = await client.request(
-                    endpoint.method,
-                    formatted_path,
-                    **request_kwargs,
-                )
-                duration_ms = (time.perf_counter() - start) * 1000
-                result.status_code = response.status_code
-                result.latency_ms = duration_ms
-                result.checked_at = time.time()
-
-                is_success = 200 <= response.status_code < 400
-                if is_success and duration_ms <= 1000:
-                    result.status = "healthy"
-                elif is_success:
-                    result.status = "warning"
+        result = job.results[endpoint.id]
+
+        payload = self._prepare_payload(endpoint)
+        if payload is None:
+            result.status = "skipped"
+            result.mark_checked()
+            job.completed += 1
+            return
+
+        start = time.perf_counter()
+        try:
+            formatted_path = self._format_path(endpoint.path, payload.get("path_params", {}))
+            headers = {
+                **(payload.get("headers") or {}),
+                "x-pulse-probe": "true",
+            }
+            request_kwargs: Dict[str, Any] = {
+                "params": payload.get("query") or None,
+                "headers": headers,
+            }
+
+            body = payload.get("body")
+            media_type = payload.get("media_type") or "application/json"
+            if body is not None:
+                if isinstance(body, (dict, list)) and media_type.startswith("application/json"):
+                    request_kwargs["json"] = body
                 else:
-                    result.status = "critical"
-                    result.error = response.text[:500]
-
-                self.metrics.record_request(
-                    endpoint=endpoint.path,
-                    method=endpoint.method,
-                    status_code=response.status_code,
-                    duration_ms=duration_ms,
-                    correlation_id="pulse-probe",
-                )
-
-            except Exception as exc:  # pragma: no cover - network issues
-                duration_ms = (time.perf_counter() - start) * 1000
+                    if isinstance(body, (dict, list)):
+                        request_kwargs["data"] = json.dumps(body)
+                    else:
+                        request_kwargs["data"] = body
+                    request_kwargs.setdefault("headers", {})["content-type"] = media_type
+
+            response = await client.request(
+                endpoint.method,
+                formatted_path,
+                **request_kwargs,
+            )
+            duration_ms = (time.perf_counter() - start) * 1000
+            result.status_code = response.status_code
+            result.latency_ms = duration_ms
+            result.mark_checked()
+
+            is_success = 200 <= response.status_code < 400
+            if is_success and duration_ms <= 1000:
+                result.status = "healthy"
+            elif is_success:
+                result.status = "warning"
+            else:
                 result.status = "critical"
-                result.error = str(exc)
-                result.status_code = None
-                result.latency_ms = duration_ms
-                result.checked_at = time.time()
-
-                self.metrics.record_request(
-                    endpoint=endpoint.path,
-                    method=endpoint.method,
-                    status_code=599,  # Non-standard to indicate probe failure
-                    duration_ms=duration_ms,
-                    correlation_id="pulse-probe",
-                )
-
-            finally:
-                result.payload = payload
-                job.completed += 1
+                result.error = response.text[:500]
+
+            self.metrics.record_request(
+                endpoint=endpoint.path,
+                method=endpoint.method,
+                status_code=response.status_code,
+                duration_ms=duration_ms,
+                correlation_id="pulse-probe",
+            )
+
+        except Exception as exc:  # pragma: no cover - network issues
+            duration_ms = (time.perf_counter() - start) * 1000
+            result.status = "critical"
+            result.error = str(exc)
+            result.status_code = None
+            result.latency_ms = duration_ms
+            result.mark_checked()
+
+            self.metrics.record_request(
+                endpoint=endpoint.path,
+                method=endpoint.method,
+                status_code=599,  # Non-standard to indicate probe failure
+                duration_ms=duration_ms,
+                correlation_id="pulse-probe",
+            )
+
+        finally:
+            result.payload = payload
+            job.completed += 1
 
     def _prepare_payload(self, endpoint: EndpointInfo) -> Optional[Dict[str, Any]]:
         override = self.payload_store.get(endpoint.id)
@@ -4,16 +4,18 @@ from __future__ import annotations
 
 import hashlib
 import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Optional
 
 from fastapi import FastAPI
 
+from .constants import DATACLASS_SLOTS
+
 ALLOWED_METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "HEAD"}
 DEFAULT_MANAGEMENT_PREFIXES = {"/health/pulse"}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class EndpointInfo:
     """Metadata describing an API endpoint derived from OpenAPI schema."""
 
@@ -33,8 +35,21 @@ class EndpointInfo:
 
     def to_dict(self) -> Dict[str, object]:
         """Serialize endpoint info for JSON responses."""
-        data = asdict(self)
-        return data
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "summary": self.summary,
+            "tags": list(self.tags),
+            "requires_input": self.requires_input,
+            "has_path_params": self.has_path_params,
+            "has_request_body": self.has_request_body,
+            "path_parameters": list(self.path_parameters),
+            "query_parameters": list(self.query_parameters),
+            "header_parameters": list(self.header_parameters),
+            "request_body_media_type": self.request_body_media_type,
+            "request_body_schema": self.request_body_schema,
+        }
 
 
 class PulseEndpointRegistry:
@@ -43,8 +58,9 @@ class PulseEndpointRegistry:
     def __init__(self, app: FastAPI, *, exclude_prefixes: Optional[Iterable[str]] = None) -> None:
         self.app = app
         self._endpoints: List[EndpointInfo] = []
-        self._schema_hash: Optional[str] = None
+        self._schema_key: Optional[object] = None
         self._openapi_schema: Dict[str, Any] = {}
+        self._routes_len = -1
         prefixes = set(DEFAULT_MANAGEMENT_PREFIXES)
         if exclude_prefixes:
             for prefix in exclude_prefixes:
@@ -55,18 +71,24 @@ class PulseEndpointRegistry:
     def refresh(self) -> None:
         """Refresh endpoint metadata when OpenAPI schema changes."""
         schema = self.app.openapi()
-        self._openapi_schema = schema
         paths = schema.get("paths", {})
-        schema_hash = hashlib.sha256(
-            json.dumps(paths, sort_keys=True, separators=(",", ":")).encode("utf-8")
-        ).hexdigest()
+        if getattr(self.app, "openapi_schema", None) is schema:
+            # FastAPI memoizes the schema until it is invalidated, so identity is
+            # a sufficient change marker. Holding a reference in _openapi_schema
+            # keeps the id from being recycled by a different dict.
+            schema_key: object = id(schema)
+        else:
+            schema_key = hashlib.sha256(
+                json.dumps(paths, sort_keys=True, separators=(",", ":")).encode("utf-8")
+            ).hexdigest()
+        self._openapi_schema = schema
 
-        if schema_hash == self._schema_hash:
+        if schema_key == self._schema_key:
             return
 
         endpoints: List[EndpointInfo] = []
         for path, operations in paths.items():
-            if any(path.startswith(prefix) for prefix in self._exclude_prefixes):
+            if path.startswith(self._exclude_prefixes):
                 continue
 
             common_parameters = operations.get("parameters", []) if isinstance(operations, dict) else []
@@ -145,13 +167,24 @@ class PulseEndpointRegistry:
 
         endpoints.sort(key=lambda e: (e.path, e.method))
         self._endpoints = endpoints
-        self._schema_hash = schema_hash
+        self._schema_key = schema_key
 
     def list_endpoints(self) -> List[EndpointInfo]:
         """Return all discovered endpoints."""
-        self.refresh()
+        self._ensure_fresh()
         return list(self._endpoints)
 
+    def _ensure_fresh(self) -> None:
+        if self._is_stale():
+            self.refresh()
+            self._routes_len = len(self.app.router.routes)
+
+    def _is_stale(self) -> bool:
+        """Return True when routes were added/removed or the cached schema was reset."""
+        if len(self.app.router.routes) != self._routes_len:
+            return True
+        return getattr(self.app, "openapi_schema", None) is not self._openapi_schema
+
     def get_endpoint_map(self) -> Dict[str, EndpointInfo]:
         """Return endpoints keyed by their identifier."""
         return {endpoint.id: endpoint for endpoint in self.list_endpoints()}
@@ -162,5 +195,5 @@ class PulseEndpointRegistry:
 
     @property
     def openapi_schema(self) -> Dict[str, Any]:
-        self.refresh()
+        self._ensure_fresh()
         return self._openapi_schema
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import json
+import threading
 from copy import deepcopy
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
-from fastapi import APIRouter, HTTPException, Request
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict
+
+try:  # Optional fast JSON encoder
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
 
 from .constants import (
     PULSE_ENDPOINT_REGISTRY_KEY,
@@ -15,6 +23,7 @@ from .constants import (
     PULSE_PROBE_MANAGER_KEY,
 )
 from .metrics import PulseMetrics
+from .middleware import SLA_LATENCY_THRESHOLD_MS
 from .payload_store import PulsePayloadStore
 from .probe import PulseProbeManager
 from .registry import EndpointInfo, PulseEndpointRegistry
@@ -24,6 +33,8 @@ from .sample_builder import SamplePayloadBuilder
 class ProbeRequest(BaseModel):
     endpoints: Optional[List[str]] = None
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
 
 class PayloadUpdate(BaseModel):
     path_params: Dict[str, Any] = {}
@@ -33,6 +44,40 @@ class PayloadUpdate(BaseModel):
     media_type: Optional[str] = None
 
 
+def _dumps(data: Any) -> bytes:
+    """Serialize *data* to JSON bytes, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+class PulseJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when available."""
+
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
+
+ERROR_RATE_SLA_PERCENT = 5
+_LATENCY_SLA_LABEL = f"{SLA_LATENCY_THRESHOLD_MS}ms"
+_ERROR_RATE_SLA_LABEL = f"{ERROR_RATE_SLA_PERCENT}%"
+
+
+# Shared by every endpoint that has not been probed yet. Read-only; the
+# endpoints route passes through jsonable_encoder, which emits a plain dict.
+_UNKNOWN_PROBE_RESULT: Mapping[str, Any] = MappingProxyType(
+    {
+        "status": "unknown",
+        "status_code": None,
+        "latency_ms": None,
+        "error": None,
+        "checked_at": None,
+        "checked_at_iso": None,
+        "payload": None,
+    }
+)
+
+
 def _get_registry(request: Request) -> PulseEndpointRegistry:
     registry = getattr(request.app.state, PULSE_ENDPOINT_REGISTRY_KEY, None)
     if registry is None:
@@ -54,21 +99,9 @@ def _get_payload_store(request: Request) -> PulsePayloadStore:
     return store
 
 
-def _serialize_probe_result(result) -> Dict[str, Any]:
+def _serialize_probe_result(result) -> Mapping[str, Any]:
     if result is None:
-        return {
-            "status": "unknown",
-            "status_code": None,
-            "latency_ms": None,
-            "error": None,
-            "checked_at": None,
-            "checked_at_iso": None,
-            "payload": None,
-        }
-
-    checked_at_iso = None
-    if result.checked_at is not None:
-        checked_at_iso = datetime.fromtimestamp(result.checked_at, tz=timezone.utc).isoformat()
+        return _UNKNOWN_PROBE_RESULT
 
     return {
         "status": result.status,
@@ -76,24 +109,47 @@ def _serialize_probe_result(result) -> Dict[str, Any]:
         "latency_ms": result.latency_ms,
         "error": result.error,
         "checked_at": result.checked_at,
-        "checked_at_iso": checked_at_iso,
+        "checked_at_iso": result.checked_at_iso,
         "payload": result.payload,
     }
 
 
+# Shared read-only metrics block for endpoints with no traffic.
+_EMPTY_ENDPOINT_METRICS: Mapping[str, Any] = MappingProxyType(
+    {
+        "total_requests": 0,
+        "success_count": 0,
+        "error_count": 0,
+        "avg_response_time": None,
+        "p95_response_time": None,
+        "error_rate": 0,
+    }
+)
+
+
+def _endpoint_metrics_by_id(metrics: PulseMetrics) -> Dict[str, Dict[str, Any]]:
+    """Map endpoint ids to their serialized metrics block."""
+    return {
+        endpoint_id: {
+            "total_requests": row["total_requests"],
+            "success_count": row["success_count"],
+            "error_count": row["error_count"],
+            "avg_response_time": row["avg_response_time"],
+            "p95_response_time": row["p95_response_time"],
+            "error_rate": (row["error_count"] / row["total_requests"]) * 100
+            if row["total_requests"]
+            else 0,
+        }
+        for endpoint_id, row in metrics.endpoint_rows_snapshot().items()
+    }
+
+
 def _serialize_endpoint(
     endpoint: EndpointInfo,
-    endpoint_metrics: Dict[str, Any],
+    endpoint_metrics: Mapping[str, Any],
     probe_result,
     payload_info: Dict[str, Any],
 ) -> Dict[str, Any]:
-    metrics_snapshot = endpoint_metrics.get(endpoint.id, {})
-    total_requests = metrics_snapshot.get("total_requests", 0)
-    error_count = metrics_snapshot.get("error_count", 0)
-    error_rate = (
-        (error_count / total_requests) * 100
-        if total_requests else 0
-    )
     return {
         "id": endpoint.id,
         "method": endpoint.method,
@@ -101,26 +157,131 @@ def _serialize_endpoint(
         "summary": endpoint.summary,
         "tags": endpoint.tags,
         "requires_input": endpoint.requires_input,
-        "metrics": {
-            "total_requests": total_requests,
-            "success_count": metrics_snapshot.get("success_count", 0),
-            "error_count": error_count,
-            "avg_response_time": metrics_snapshot.get("avg_response_time"),
-            "p95_response_time": metrics_snapshot.get("p95_response_time"),
-            "error_rate": error_rate,
-        },
+        "metrics": endpoint_metrics,
         "last_probe": _serialize_probe_result(probe_result),
         "payload": payload_info,
     }
 
 
-def create_pulse_router(metrics: PulseMetrics) -> APIRouter:
-    """Build a router that serves pulse metrics derived from *metrics*."""
+def _build_endpoints_payload(
+    registry: PulseEndpointRegistry,
+    manager: PulseProbeManager,
+    payload_store: PulsePayloadStore,
+    metrics: PulseMetrics,
+) -> Dict[str, Any]:
+    """Assemble the /health/pulse/endpoints response body."""
+    builder = SamplePayloadBuilder(registry.openapi_schema)
+
+    endpoints = registry.list_endpoints()
+    metrics_by_id = _endpoint_metrics_by_id(metrics)
+    last_job = manager.last_job()
+    probe_results = last_job.results if last_job else {}
+    payload_entries = []
+    auto_count = 0
+    requires_input_count = 0
+
+    for endpoint in endpoints:
+        custom_payload = payload_store.get(endpoint.id)
+        generated_payload = builder.build(endpoint)
+        effective_payload = None
+        source = "none"
+        if custom_payload:
+            effective_payload = deepcopy(custom_payload)
+            source = "custom"
+        elif generated_payload:
+            effective_payload = deepcopy(generated_payload)
+            source = "generated"
+
+        can_probe = effective_payload is not None
+        if can_probe:
+            auto_count += 1
+            effective_payload["source"] = source
+        else:
+            requires_input_count += 1
+
+        payload_info = {
+            "source": source,
+            "custom": custom_payload,
+            "generated": generated_payload,
+            "effective": effective_payload,
+        }
+
+        payload_entries.append(
+            _serialize_endpoint(
+                endpoint,
+                metrics_by_id.get(endpoint.id, _EMPTY_ENDPOINT_METRICS),
+                probe_results.get(endpoint.id),
+                payload_info,
+            )
+        )
+
+    response: Dict[str, Any] = {
+        "endpoints": payload_entries,
+        "summary": {
+            "total": len(endpoints),
+            "auto_probed": auto_count,
+            "requires_input": requires_input_count,
+        },
+    }
+
+    if last_job:
+        response["summary"].update(
+            {
+                "last_job_id": last_job.job_id,
+                "last_job_status": last_job.status,
+                "last_job_started_at": last_job.started_at,
+                "last_job_completed_at": last_job.completed_at,
+            }
+        )
+
+    return response
+
+
+def create_pulse_router(
+    metrics: PulseMetrics,
+    *,
+    registry: Optional[PulseEndpointRegistry] = None,
+    manager: Optional[PulseProbeManager] = None,
+    payload_store: Optional[PulsePayloadStore] = None,
+    include_legacy_sla_strings: bool = True,
+) -> APIRouter:
+    """Build a router that serves pulse metrics derived from *metrics*.
+
+    A registry, probe manager or payload store passed in is bound into the
+    route handlers directly; any left as ``None`` is looked up on
+    ``request.app.state`` per request, as set up by ``add_pulse``.
+
+    When *include_legacy_sla_strings* is True, ``sla_compliance.details`` with
+    pre-formatted strings is added to the ``/health/pulse`` response. The
+    strings are deprecated and will be off by default in the next release.
+    """
+
+    router = APIRouter(
+        prefix="/health",
+        tags=["Pulse Metrics"],
+        default_response_class=PulseJSONResponse,
+    )
+
+    def resolve_registry(request: Request) -> PulseEndpointRegistry:
+        return registry if registry is not None else _get_registry(request)
+
+    def resolve_manager(request: Request) -> PulseProbeManager:
+        return manager if manager is not None else _get_probe_manager(request)
+
+    def resolve_payload_store(request: Request) -> PulsePayloadStore:
+        return payload_store if payload_store is not None else _get_payload_store(request)
 
-    router = APIRouter(prefix="/health", tags=["Pulse Metrics"])
+    # Serialized /health/pulse body, reused until the metrics snapshot changes.
+    pulse_cache_lock = threading.Lock()
+    pulse_cache: Dict[str, Any] = {"key": None, "body": b""}
 
-    @router.get("/pulse", response_model_exclude_none=True)
+    @router.get("/pulse")
     def get_pulse_metrics():
+        snapshot_key = metrics.snapshot_key()
+        with pulse_cache_lock:
+            if pulse_cache["key"] == snapshot_key:
+                return Response(content=pulse_cache["body"], media_type="application/json")
+
         performance_metrics = metrics.get_metrics()
 
         summary = performance_metrics.get("summary", {})
@@ -128,154 +289,96 @@ def create_pulse_router(metrics: PulseMetrics) -> APIRouter:
 
         if "p95_response_time" in summary:
             p95_response_time = summary["p95_response_time"]
-            latency_sla_met = p95_response_time < 200
+            latency_sla_met = p95_response_time < SLA_LATENCY_THRESHOLD_MS
         else:
             p95_response_time = 0
             latency_sla_met = None
 
-        error_rate_sla_met = error_rate < 5
+        error_rate_sla_met = error_rate < ERROR_RATE_SLA_PERCENT
 
         if latency_sla_met is None:
             overall_sla_met = None
         else:
             overall_sla_met = latency_sla_met and error_rate_sla_met
 
+        sla_compliance: Dict[str, Any] = {
+            "latency_sla_met": latency_sla_met,
+            "error_rate_sla_met": error_rate_sla_met,
+            "overall_sla_met": overall_sla_met,
+        }
+        if include_legacy_sla_strings:
+            sla_compliance["details"] = {
+                "p95_response_time": "%.2fms" % p95_response_time,
+                "p95_response_time_sla": _LATENCY_SLA_LABEL,
+                "error_rate": "%.2f%%" % error_rate,
+                "error_rate_sla": _ERROR_RATE_SLA_LABEL,
+            }
+
         response_data = {
             "performance_metrics": performance_metrics,
-            "sla_compliance": {
-                "latency_sla_met": latency_sla_met,
-                "error_rate_sla_met": error_rate_sla_met,
-                "overall_sla_met": overall_sla_met,
-                "details": {
-                    "p95_response_time": f"{p95_response_time:.2f}ms",
-                    "p95_response_time_sla": "200ms",
-                    "error_rate": f"{error_rate:.2f}%",
-                    "error_rate_sla": "5%",
-                },
-            },
+            "sla_compliance": sla_compliance,
         }
 
-        return response_data
+        body = _dumps(response_data)
+        with pulse_cache_lock:
+            pulse_cache["key"] = snapshot_key
+            pulse_cache["body"] = body
+        return Response(content=body, media_type="application/json")
 
     @router.get("/pulse/endpoints")
     def list_endpoints(request: Request):
-        registry = _get_registry(request)
-        manager = _get_probe_manager(request)
-        payload_store = _get_payload_store(request)
-        builder = SamplePayloadBuilder(registry.openapi_schema)
-
-        endpoints = registry.list_endpoints()
-        metrics_snapshot = metrics.get_metrics().get("endpoint_metrics", {})
-        last_job = manager.last_job()
-        probe_results = last_job.results if last_job else {}
-        payload_entries = []
-        auto_count = 0
-        requires_input_count = 0
-
-        for endpoint in endpoints:
-            custom_payload = payload_store.get(endpoint.id)
-            generated_payload = builder.build(endpoint)
-            effective_payload = None
-            source = "none"
-            if custom_payload:
-                effective_payload = deepcopy(custom_payload)
-                source = "custom"
-            elif generated_payload:
-                effective_payload = deepcopy(generated_payload)
-                source = "generated"
-
-            can_probe = effective_payload is not None
-            if can_probe:
-                auto_count += 1
-                effective_payload["source"] = source
-            else:
-                requires_input_count += 1
-
-            payload_info = {
-                "source": source,
-                "custom": custom_payload,
-                "generated": generated_payload,
-                "effective": effective_payload,
-            }
-
-            payload_entries.append(
-                _serialize_endpoint(
-                    endpoint,
-                    metrics_snapshot,
-                    probe_results.get(endpoint.id),
-                    payload_info,
-                )
-            )
-
-        response: Dict[str, Any] = {
-            "endpoints": payload_entries,
-            "summary": {
-                "total": len(endpoints),
-                "auto_probed": auto_count,
-                "requires_input": requires_input_count,
-            },
-        }
-
-        if last_job:
-            response["summary"].update(
-                {
-                    "last_job_id": last_job.job_id,
-                    "last_job_status": last_job.status,
-                    "last_job_started_at": last_job.started_at,
-                    "last_job_completed_at": last_job.completed_at,
-                }
-            )
-
-        return response
+        return _build_endpoints_payload(
+            resolve_registry(request),
+            resolve_manager(request),
+            resolve_payload_store(request),
+            metrics,
+        )
 
     @router.post("/pulse/probe")
     async def trigger_probe(request: Request, payload: Optional[ProbeRequest] = None):
-        registry = _get_registry(request)
-        manager = _get_probe_manager(request)
-
-        endpoint_map = registry.get_endpoint_map()
+        endpoint_registry = resolve_registry(request)
+        probe_manager = resolve_manager(request)
+        endpoint_map = endpoint_registry.get_endpoint_map()
 
         if payload and payload.endpoints:
-            missing = [endpoint_id for endpoint_id in payload.endpoints if endpoint_id not in endpoint_map]
-            if missing:
+            requested = payload.endpoints
+            unknown = set(requested) - endpoint_map.keys()
+            if unknown:
+                # Error path only: report in request order for a stable message.
+                missing = [endpoint_id for endpoint_id in requested if endpoint_id in unknown]
                 raise HTTPException(status_code=404, detail={"missing_endpoints": missing})
-            targets = [endpoint_map[endpoint_id] for endpoint_id in payload.endpoints]
+            targets = list(map(endpoint_map.__getitem__, requested))
         else:
-            targets = registry.list_endpoints()
+            targets = endpoint_registry.list_endpoints()
 
-        job_id = manager.start_probe(targets)
-        job = manager.get_job(job_id)
+        job_id = probe_manager.start_probe(targets)
+        job = probe_manager.get_job(job_id)
         return {"job_id": job_id, "total": job.total_targets if job else len(targets)}
 
     @router.get("/pulse/probe/{job_id}")
     def probe_status(request: Request, job_id: str):
-        manager = _get_probe_manager(request)
-        job = manager.get_job(job_id)
+        job = resolve_manager(request).get_job(job_id)
         if job is None:
             raise HTTPException(status_code=404, detail="Probe job not found")
         return job.to_dict()
 
     @router.put("/pulse/probe/{endpoint_id:path}/payload")
     def save_payload(request: Request, endpoint_id: str, update: PayloadUpdate):
-        registry = _get_registry(request)
-        payload_store = _get_payload_store(request)
-        endpoint_map = registry.get_endpoint_map()
+        endpoint_map = resolve_registry(request).get_endpoint_map()
         if endpoint_id not in endpoint_map:
             raise HTTPException(status_code=404, detail="Endpoint not found")
 
-        stored = payload_store.set(endpoint_id, update.model_dump())
+        stored = resolve_payload_store(request).set(endpoint_id, update.model_dump())
         stored["source"] = "custom"
         return {"status": "ok", "payload": stored}
 
     @router.delete("/pulse/probe/{endpoint_id:path}/payload")
     def delete_payload(request: Request, endpoint_id: str):
-        registry = _get_registry(request)
-        payload_store = _get_payload_store(request)
-        endpoint_map = registry.get_endpoint_map()
+        endpoint_map = resolve_registry(request).get_endpoint_map()
         if endpoint_id not in endpoint_map:
             raise HTTPException(status_code=404, detail="Endpoint not found")
 
-        payload_store.delete(endpoint_id)
+        resolve_payload_store(request).delete(endpoint_id)
         return {"status": "ok"}
 
     return router
@@ -9,10 +9,10 @@ tasks, etc.).
 from __future__ import annotations
 
 import asyncio
+import itertools
 import random
 import time
-from collections import deque
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
 import uvicorn
 from fastapi import BackgroundTasks, FastAPI, HTTPException
@@ -21,6 +21,11 @@ from pydantic import BaseModel, Field
 
 from fastapi_pulse import add_pulse
 
+try:  # NumPy is optional for the playground; fall back to pure Python without it.
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
 
 class ProductIn(BaseModel):
     name: str = Field(..., example="Pulse Monitor")
@@ -38,6 +43,28 @@ class OrderOut(OrderIn):
     status: str
 
 
+class EventRing:
+    """Fixed-size ring of the most recent order events.
+
+    Writers all run on the event loop, so slots are overwritten in place
+    without locking; readers walk backwards from the head.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._slots: List[Optional[str]] = [None] * size
+        self._head = 0
+
+    def push(self, event: str) -> None:
+        self._slots[self._head % len(self._slots)] = event
+        self._head += 1
+
+    def snapshot(self) -> List[str]:
+        """Return the retained events, newest first."""
+        size = len(self._slots)
+        head = self._head
+        return [self._slots[i % size] for i in range(head - 1, max(head - size, 0) - 1, -1)]
+
+
 app = FastAPI(title="FastAPI Pulse Playground")
 add_pulse(app, enable_detailed_logging=True)
 
@@ -48,7 +75,9 @@ PRODUCT_DB: Dict[int, ProductIn] = {
     2: ProductIn(name="Latency Analyzer", price=49.0, tags=["tool", "latency"]),
 }
 ORDER_DB: Dict[int, OrderOut] = {}
-ORDER_EVENTS: deque[str] = deque(maxlen=25)
+_product_ids = itertools.count(max(PRODUCT_DB, default=0) + 1)
+_order_ids = itertools.count(max(ORDER_DB, default=1000) + 1)
+ORDER_EVENTS = EventRing(25)
 
 
 @app.get("/")
@@ -80,7 +109,7 @@ async def list_products() -> Dict[str, List[ProductIn]]:
 
 @app.post("/products", status_code=201)
 async def create_product(product: ProductIn) -> Dict[str, ProductIn]:
-    product_id = max(PRODUCT_DB.keys()) + 1
+    product_id = next(_product_ids)
     PRODUCT_DB[product_id] = product
     return {"product_id": product_id, "product": product}
 
@@ -93,31 +122,31 @@ async def get_product(product_id: int) -> ProductIn:
     return product
 
 
-@app.post("/orders", response_model=OrderOut, status_code=201)
-async def create_order(order: OrderIn, background_tasks: BackgroundTasks) -> OrderOut:
+@app.post("/orders", response_model=None, status_code=201)
+async def create_order(order: OrderIn, background_tasks: BackgroundTasks) -> Dict[str, Any]:
     if order.product_id not in PRODUCT_DB:
         raise HTTPException(status_code=404, detail="Product not found")
 
-    order_id = max(ORDER_DB.keys(), default=1000) + 1
-    order_out = OrderOut(order_id=order_id, status="queued", **order.dict())
+    order_id = next(_order_ids)
+    order_out = OrderOut(order_id=order_id, status="queued", **order.model_dump())
     ORDER_DB[order_id] = order_out
 
     background_tasks.add_task(_simulate_order_fulfillment, order_id)
-    ORDER_EVENTS.appendleft(f"Order {order_id} queued")
-    return order_out
+    ORDER_EVENTS.push(f"Order {order_id} queued")
+    return order_out.model_dump()
 
 
-@app.get("/orders/{order_id}", response_model=OrderOut)
-async def get_order(order_id: int) -> OrderOut:
+@app.get("/orders/{order_id}", response_model=None)
+async def get_order(order_id: int) -> Dict[str, Any]:
     order = ORDER_DB.get(order_id)
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
-    return order
+    return order.model_dump()
 
 
 @app.get("/orders/events")
 async def order_events() -> Dict[str, List[str]]:
-    return {"events": list(ORDER_EVENTS)}
+    return {"events": ORDER_EVENTS.snapshot()}
 
 
 async def _simulate_order_fulfillment(order_id: int) -> None:
@@ -125,13 +154,13 @@ async def _simulate_order_fulfillment(order_id: int) -> None:
     order = ORDER_DB.get(order_id)
     if order:
         order.status = "processing"
-        ORDER_EVENTS.appendleft(f"Order {order_id} processing")
+        ORDER_EVENTS.push(f"Order {order_id} processing")
 
     await asyncio.sleep(0.7)
     order = ORDER_DB.get(order_id)
     if order:
         order.status = "fulfilled"
-        ORDER_EVENTS.appendleft(f"Order {order_id} fulfilled")
+        ORDER_EVENTS.push(f"Order {order_id} fulfilled")
 
 
 @app.get("/stream")
@@ -141,7 +170,7 @@ async def stream_numbers(limit: int = 5) -> StreamingResponse:
     async def number_generator():
         for i in range(1, limit + 1):
             await asyncio.sleep(0.25)
-            yield f"data: {i}\n"
+            yield b"data: %d\n" % i
 
     return StreamingResponse(number_generator(), media_type="text/event-stream")
 
@@ -156,7 +185,11 @@ def error_endpoint() -> Dict[str, str]:
 def cpu_intensive() -> Dict[str, float]:
     """CPU-intensive endpoint performing heavy synchronous work."""
     start = time.perf_counter()
-    _ = sum(i * i for i in range(200_000))
+    if np is not None:
+        values = np.arange(200_000, dtype=np.int64)
+        _ = int((values * values).sum())
+    else:
+        _ = sum(i * i for i in range(200_000))
     duration = time.perf_counter() - start
     return {"duration": duration}
 
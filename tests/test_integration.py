@@ -6,6 +6,8 @@ and probe manager work together correctly within a real FastAPI application.
 """
 
 import asyncio
+import logging
+from contextlib import asynccontextmanager
 from urllib.parse import quote
 
 import pytest
@@ -14,10 +16,12 @@ from fastapi.testclient import TestClient
 from pydantic import BaseModel
 
 from fastapi_pulse import (
+    PULSE_PROBE_MANAGER_KEY,
     PULSE_STATE_KEY,
     PulseMetrics,
     add_pulse,
 )
+from fastapi_pulse.router import create_pulse_router
 
 # Pytest-asyncio marker
 pytestmark = pytest.mark.asyncio
@@ -214,3 +218,154 @@ async def test_endpoint_registry_and_probe_flow(client: TestClient):
     refreshed = client.get("/health/pulse/endpoints").json()
     widget_row = next(item for item in refreshed["endpoints"] if item["id"] == endpoint_id)
     assert widget_row["payload"]["source"] == "generated"
+
+
+async def test_excluded_paths_bypass_instrumentation(client: TestClient):
+    """Pulse's own routes are served untouched and never recorded."""
+    response = client.get("/health/pulse")
+    assert response.status_code == 200
+    assert "x-response-time-ms" not in response.headers
+
+    endpoint_metrics = client.get("/health/pulse").json()["performance_metrics"]["endpoint_metrics"]
+    assert not any("/health/pulse" in key for key in endpoint_metrics)
+
+
+async def test_pulse_response_is_cached_until_metrics_change(client: TestClient):
+    """Repeated scrapes reuse the serialized body until a new request is recorded."""
+    metrics = getattr(client.app.state, PULSE_STATE_KEY)
+    metrics.record_request(endpoint="/cached", method="GET", status_code=200, duration_ms=10.0)
+
+    first = client.get("/health/pulse")
+    second = client.get("/health/pulse")
+    assert first.content == second.content
+
+    metrics.record_request(endpoint="/cached", method="GET", status_code=200, duration_ms=20.0)
+    refreshed = client.get("/health/pulse").json()
+    assert refreshed["performance_metrics"]["endpoint_metrics"]["GET /cached"]["total_requests"] == 2
+
+
+async def test_endpoint_listing_joins_live_metrics(client: TestClient):
+    """Endpoint rows carry the recorded counters and derived error rate."""
+    client.get("/test/success")
+    client.get("/test/error")
+
+    rows = {row["id"]: row for row in client.get("/health/pulse/endpoints").json()["endpoints"]}
+    assert rows["GET /test/success"]["metrics"]["total_requests"] == 1
+    assert rows["GET /test/success"]["metrics"]["error_rate"] == 0
+    assert rows["GET /test/error"]["metrics"]["error_rate"] == 100
+    assert rows["POST /test/widget"]["metrics"]["total_requests"] == 0
+    assert rows["POST /test/widget"]["metrics"]["avg_response_time"] is None
+
+
+async def test_legacy_sla_strings_can_be_disabled():
+    """Formatted SLA detail strings are still emitted by default but can be dropped."""
+    default_app = FastAPI()
+    add_pulse(default_app)
+    lean_app = FastAPI()
+    add_pulse(lean_app, include_legacy_sla_strings=False)
+
+    with TestClient(lean_app) as lean_client:
+        assert "details" not in lean_client.get("/health/pulse").json()["sla_compliance"]
+    with TestClient(default_app) as default_client:
+        details = default_client.get("/health/pulse").json()["sla_compliance"]["details"]
+    assert details["p95_response_time"] == "0.00ms"
+    assert details["error_rate"] == "0.00%"
+    assert details["p95_response_time_sla"] == "200ms"
+
+
+async def test_probe_rejects_unknown_endpoints(client: TestClient):
+    """Unknown endpoint ids are reported back in request order."""
+    response = client.post(
+        "/health/pulse/probe",
+        json={"endpoints": ["GET /nope", "GET /test/success", "POST /missing"]},
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == {"missing_endpoints": ["GET /nope", "POST /missing"]}
+
+
+async def test_probe_request_rejects_unexpected_fields(client: TestClient):
+    """Probe requests only accept the documented ``endpoints`` field."""
+    response = client.post("/health/pulse/probe", json={"endpoint": ["GET /test/success"]})
+    assert response.status_code == 422
+
+
+async def test_probe_client_is_closed_with_custom_lifespan():
+    """The shared probe client is closed even when the app uses ``lifespan=``."""
+    events = []
+
+    @asynccontextmanager
+    async def lifespan(app):
+        events.append("startup")
+        yield
+        events.append("shutdown")
+
+    app = FastAPI(lifespan=lifespan)
+    add_pulse(app)
+    manager = getattr(app.state, PULSE_PROBE_MANAGER_KEY)
+
+    with TestClient(app):
+        client = await manager._get_client()
+        assert not client.is_closed
+
+    assert events == ["startup", "shutdown"]
+    assert client.is_closed
+    assert manager._client is None
+
+
+async def test_background_logging_is_opt_in_and_follows_lifespan():
+    """Pulse leaves logger state alone by default and restores it on shutdown."""
+    middleware_logger = logging.getLogger("fastapi_pulse.middleware")
+
+    app = FastAPI()
+    add_pulse(app)
+    with TestClient(app):
+        assert middleware_logger.propagate is True
+        assert not middleware_logger.handlers
+
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+
+    queued_app = FastAPI(lifespan=lifespan)
+    add_pulse(queued_app, enable_background_logging=True)
+    with TestClient(queued_app):
+        assert middleware_logger.propagate is False
+        assert len(middleware_logger.handlers) == 1
+
+    assert middleware_logger.propagate is True
+    assert not middleware_logger.handlers
+
+
+async def test_create_pulse_router_falls_back_to_app_state():
+    """Routers built with only ``metrics`` resolve pulse objects from ``app.state``."""
+    app = FastAPI()
+    add_pulse(app)
+
+    @app.get("/things")
+    async def list_things():
+        return []
+
+    app.include_router(
+        create_pulse_router(getattr(app.state, PULSE_STATE_KEY)), prefix="/legacy"
+    )
+
+    with TestClient(app) as client:
+        response = client.get("/legacy/health/pulse/endpoints")
+        assert response.status_code == 200
+        assert "GET /things" in [endpoint["id"] for endpoint in response.json()["endpoints"]]
+
+        job = client.post("/legacy/health/pulse/probe", json={"endpoints": ["GET /things"]})
+        assert job.status_code == 200
+        status = client.get(f"/legacy/health/pulse/probe/{job.json()['job_id']}")
+        assert status.status_code == 200
+
+
+async def test_never_probed_endpoints_report_unknown_status(client: TestClient):
+    """Endpoints without probes or traffic serialize the shared read-only placeholders."""
+    endpoints = client.get("/health/pulse/endpoints").json()["endpoints"]
+    assert endpoints
+    for endpoint in endpoints:
+        assert endpoint["last_probe"]["status"] == "unknown"
+        assert endpoint["last_probe"]["checked_at_iso"] is None
+        assert endpoint["metrics"]["total_requests"] == 0
+        assert endpoint["metrics"]["p95_response_time"] is None
@@ -4,7 +4,12 @@ Tests for the core PulseMetrics collector.
 
 import pytest
 import numpy as np
-from fastapi_pulse.metrics import PulseMetrics
+from fastapi_pulse.metrics import (
+    PulseMetrics,
+    RollingWindowDigest,
+    RollingWindowHistogram,
+    _bucket_index,
+)
 
 def test_initial_state():
     """Verify that a new PulseMetrics instance is empty."""
@@ -78,3 +83,60 @@ def test_percentile_with_insufficient_data():
     
     summary = metrics.get_metrics()["summary"]
     assert "p95_response_time" not in summary
+
+@pytest.mark.parametrize("scale", [0.01, 1.0, 100.0, 10_000.0])
+def test_histogram_percentiles_across_magnitudes(scale):
+    """Histogram percentiles stay within a few percent over many orders of magnitude."""
+    histogram = RollingWindowHistogram()
+    durations = [scale * d for d in range(1, 101)]
+    for d in durations:
+        histogram.add(d)
+
+    for percentile in (50, 95, 99):
+        expected = np.percentile(durations, percentile, method="linear")
+        assert histogram.percentile(percentile) == pytest.approx(expected, rel=0.05)
+
+def test_histogram_expires_old_samples():
+    """Samples that fall out of the rolling window no longer contribute."""
+    histogram = RollingWindowHistogram(window_seconds=120, bucket_seconds=60)
+    now = 1_000_000.0
+    histogram.add(500.0, timestamp=now - 600)
+    histogram.add(600.0, timestamp=now - 600)
+    histogram.add(10.0, timestamp=now)
+    histogram.add(20.0, timestamp=now)
+
+    histogram._trim(now)
+    assert histogram._count == 2
+    assert histogram._total == pytest.approx(30.0)
+    assert sum(histogram._aggregate.values()) == 2
+    assert histogram._aggregate == {
+        _bucket_index(10.0): 1,
+        _bucket_index(20.0): 1,
+    }
+
+def test_endpoint_metrics_are_memoized_between_records():
+    """Endpoint latency stats are reused until a new request is recorded."""
+    metrics = PulseMetrics()
+    metrics.record_request(endpoint="/", method="GET", status_code=200, duration_ms=10)
+
+    first = metrics.get_metrics()["endpoint_metrics"]["GET /"]
+    assert metrics.get_metrics()["endpoint_metrics"]["GET /"] == first
+    assert first["avg_response_time"] == pytest.approx(10)
+
+    # Mutating a returned row must not leak into later snapshots.
+    first["total_requests"] = 999
+    assert metrics.get_metrics()["endpoint_metrics"]["GET /"]["total_requests"] == 1
+
+    metrics.record_request(endpoint="/", method="GET", status_code=200, duration_ms=30)
+    updated = metrics.get_metrics()["endpoint_metrics"]["GET /"]
+    assert updated["total_requests"] == 2
+    assert updated["avg_response_time"] == pytest.approx(20)
+    assert metrics.endpoint_metrics["GET /"] == updated
+
+def test_rolling_window_digest_is_a_deprecated_alias():
+    """The TDigest-era class name still works but warns."""
+    with pytest.warns(DeprecationWarning):
+        digest = RollingWindowDigest(window_seconds=120, bucket_seconds=60, delta=0.01, K=25)
+    assert isinstance(digest, RollingWindowHistogram)
+    digest.add(10.0)
+    assert digest.count() == 1
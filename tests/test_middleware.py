@@ -0,0 +1,221 @@
+"""
+Tests for the PulseMiddleware helpers.
+"""
+
+import logging
+import threading
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from fastapi_pulse.metrics import PulseMetrics
+from fastapi_pulse.middleware import (
+    METRICS_QUEUE_MAXSIZE,
+    PulseMiddleware,
+    _normalize_path_cached,
+    disable_queued_logging,
+    enable_queued_logging,
+    logger as middleware_logger,
+)
+
+
+@pytest.mark.parametrize(
+    "raw_path, expected",
+    [
+        ("/users", "/users"),
+        ("/api/v-two/users", "/api/v-two/users"),
+        ("/items/abcdefab-abcd-abcd-abcd-abcdefabcdef", "/items/{id}"),
+        ("/users/42", "/users/{id}"),
+        ("/users/42/orders/7", "/users/{id}/orders/{id}"),
+        ("/items/123e4567-e89b-12d3-a456-426614174000", "/items/{id}"),
+        ("/items/12345678-1234-1234-1234-123456789abc", "/items/{id}"),
+        ("/items/123E4567-E89B-12D3-A456-426614174000/tags", "/items/{id}/tags"),
+    ],
+)
+def test_normalize_path_groups_identifiers(raw_path, expected):
+    """Numeric and UUID path segments should collapse into a single placeholder."""
+    assert _normalize_path_cached(raw_path) == expected
+
+
+async def _ok_app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        message = await receive()
+        await send({"type": f"{message['type']}.complete"})
+        return
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def _http_get(app, path):
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app({"type": "http", "method": "GET", "path": path, "headers": []}, receive, send)
+
+
+async def _lifespan_shutdown(app):
+    sent = []
+
+    async def receive():
+        return {"type": "lifespan.shutdown"}
+
+    async def send(message):
+        sent.append(message["type"])
+
+    await app({"type": "lifespan"}, receive, send)
+    return sent
+
+
+@pytest.mark.asyncio
+async def test_queued_measurements_are_flushed_on_shutdown():
+    """Measurements still queued at shutdown are recorded and overflow is dropped."""
+    metrics = PulseMetrics()
+    middleware = PulseMiddleware(_ok_app, metrics=metrics, enable_detailed_logging=False)
+
+    # The inner app never suspends, so the drain task gets no chance to run.
+    for _ in range(METRICS_QUEUE_MAXSIZE + 1):
+        await _http_get(middleware, "/queued")
+
+    assert middleware.dropped_measurements == 1
+    assert "GET /queued" not in metrics.get_metrics()["endpoint_metrics"]
+
+    assert await _lifespan_shutdown(middleware) == ["lifespan.shutdown.complete"]
+
+    endpoint_metrics = metrics.get_metrics()["endpoint_metrics"]["GET /queued"]
+    assert endpoint_metrics["total_requests"] == METRICS_QUEUE_MAXSIZE
+    assert middleware._drain_task is None
+
+
+@pytest.mark.asyncio
+async def test_queue_overflow_warnings_are_throttled(caplog):
+    """Overflow is reported on the 1st, 2nd, 4th... drop rather than only once."""
+    middleware = PulseMiddleware(_ok_app, metrics=PulseMetrics(), enable_detailed_logging=False)
+
+    with caplog.at_level(logging.WARNING, logger="fastapi_pulse.middleware"):
+        for _ in range(METRICS_QUEUE_MAXSIZE + 5):
+            await _http_get(middleware, "/queued")
+        await _lifespan_shutdown(middleware)
+
+    reported = [
+        record.dropped_measurements
+        for record in caplog.records
+        if record.getMessage() == "Pulse metrics queue is full; dropping measurements"
+    ]
+    assert reported == [1, 2, 4]
+
+
+def test_request_counts_are_complete_after_app_shutdown():
+    """Every request sent through a running app is counted once it shuts down."""
+    metrics = PulseMetrics()
+    app = FastAPI()
+    app.add_middleware(PulseMiddleware, metrics=metrics, enable_detailed_logging=False)
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int):
+        return {"item_id": item_id}
+
+    with TestClient(app) as client:
+        for item_id in range(50):
+            assert client.get(f"/items/{item_id}").status_code == 200
+
+    endpoint_metrics = metrics.get_metrics()["endpoint_metrics"]["GET /items/{id}"]
+    assert endpoint_metrics["total_requests"] == 50
+
+
+def test_measurements_are_recorded_without_an_asyncio_loop():
+    """Under trio there is no asyncio loop, so measurements are recorded inline."""
+    trio = pytest.importorskip("trio")
+    metrics = PulseMetrics()
+    middleware = PulseMiddleware(_ok_app, metrics=metrics, enable_detailed_logging=False)
+
+    async def main():
+        await _http_get(middleware, "/trio/1")
+        await _lifespan_shutdown(middleware)
+
+    trio.run(main)
+    assert metrics.get_metrics()["endpoint_metrics"]["GET /trio/{id}"]["total_requests"] == 1
+
+    app = FastAPI()
+    app.add_middleware(PulseMiddleware, metrics=metrics, enable_detailed_logging=False)
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int):
+        return {"item_id": item_id}
+
+    with TestClient(app, backend="trio") as client:
+        assert client.get("/items/1").status_code == 200
+
+    assert metrics.get_metrics()["endpoint_metrics"]["GET /items/{id}"]["total_requests"] == 1
+
+
+def test_response_time_header_replaces_app_value():
+    """An app-set ``x-response-time-ms`` header is overwritten, not duplicated."""
+    app = FastAPI()
+    app.add_middleware(PulseMiddleware, metrics=PulseMetrics(), enable_detailed_logging=False)
+
+    @app.get("/timed")
+    async def timed(response: Response):
+        response.headers["X-Response-Time-Ms"] = "app-value"
+        return {}
+
+    with TestClient(app) as client:
+        values = client.get("/timed").headers.get_list("x-response-time-ms")
+
+    assert len(values) == 1
+    assert values[0] != "app-value"
+
+
+@pytest.mark.parametrize(
+    "path, skipped",
+    [
+        ("/pulse", True),
+        ("/pulse/", True),
+        ("/pulse/js/app.js", True),
+        ("/pulsefoo", False),
+        ("/health/pulse/endpoints", True),
+        ("/health", False),
+        ("/", False),
+    ],
+)
+def test_should_skip_tracking_matches_whole_segments(path, skipped):
+    """Excluded prefixes only match exact paths or whole path segments."""
+    middleware = PulseMiddleware(
+        app=None,
+        metrics=PulseMetrics(),
+        exclude_path_prefixes=("/health/pulse", "pulse/"),
+    )
+    assert middleware._should_skip_tracking(path) is skipped
+
+
+def test_queued_logging_emits_from_background_thread():
+    """Middleware records are handled off the calling thread and flushed on disable."""
+    handled_on = []
+
+    class RecordingHandler(logging.Handler):
+        def emit(self, record):
+            handled_on.append((record, threading.current_thread()))
+
+    handler = RecordingHandler()
+    package_logger = logging.getLogger("fastapi_pulse")
+    package_logger.addHandler(handler)
+    try:
+        enable_queued_logging()
+        middleware_logger.warning("queued alert")
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            middleware_logger.exception("queued failure")
+        disable_queued_logging()
+    finally:
+        package_logger.removeHandler(handler)
+
+    assert [record.getMessage() for record, _ in handled_on] == ["queued alert", "queued failure"]
+    assert handled_on[0][1] is not threading.current_thread()
+    # Exception objects reach downstream handlers instead of being flattened.
+    assert handled_on[1][0].exc_info[0] is RuntimeError
+    assert middleware_logger.propagate is True
+    assert not middleware_logger.handlers
@@ -0,0 +1,60 @@
+"""
+Tests for the PulseProbeManager.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import FastAPI
+
+from fastapi_pulse.metrics import PulseMetrics
+from fastapi_pulse.payload_store import PulsePayloadStore
+from fastapi_pulse.probe import ProbeJob, ProbeResult, PulseProbeManager, _format_utc_iso
+from fastapi_pulse.registry import PulseEndpointRegistry
+
+
+@pytest.fixture
+def manager(tmp_path):
+    app = FastAPI()
+    return PulseProbeManager(
+        app,
+        PulseMetrics(),
+        registry=PulseEndpointRegistry(app),
+        payload_store=PulsePayloadStore(tmp_path / "pulse_probes.json"),
+        max_jobs=2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_job_history_is_bounded(manager):
+    """Only the most recent ``max_jobs`` probe jobs are retained."""
+    job_ids = [manager.start_probe([]) for _ in range(3)]
+    for job_id in job_ids[1:]:
+        await manager.wait_for_completion(job_id)
+
+    assert manager.get_job(job_ids[0]) is None
+    assert manager.get_job(job_ids[1]) is not None
+    assert manager.last_job().job_id == job_ids[2]
+    await manager.aclose()
+
+
+def test_job_to_dict_is_reused_until_progress():
+    """Serialized jobs are cached until completion count or status change."""
+    job = ProbeJob(job_id="job", total_targets=1)
+    job.results["GET /"] = ProbeResult(endpoint_id="GET /", method="GET", path="/", status="queued")
+
+    first = job.to_dict()
+    assert job.to_dict() is first
+
+    job.results["GET /"].status = "healthy"
+    job.completed += 1
+    refreshed = job.to_dict()
+    assert refreshed is not first
+    assert refreshed["results"]["GET /"]["status"] == "healthy"
+
+
+@pytest.mark.parametrize("timestamp", [0.0, 1700000000.0, 1700000000.25, 1700000000.9999996, 1234567890.123456])
+def test_format_utc_iso_matches_datetime(timestamp):
+    """The hand-rolled formatter renders exactly what ``datetime.isoformat`` would."""
+    expected = datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+    assert _format_utc_iso(timestamp) == expected
@@ -0,0 +1,99 @@
+"""
+Tests for the PulseEndpointRegistry.
+"""
+
+from fastapi import FastAPI
+
+from fastapi_pulse.registry import EndpointInfo, PulseEndpointRegistry
+
+
+def test_refresh_tracks_openapi_schema_invalidation():
+    """The registry only rescans when FastAPI regenerates its OpenAPI schema."""
+    app = FastAPI()
+
+    @app.get("/items")
+    async def list_items():
+        return []
+
+    registry = PulseEndpointRegistry(app)
+    assert [endpoint.id for endpoint in registry.list_endpoints()] == ["GET /items"]
+    cached_endpoints = registry._endpoints
+
+    registry.refresh()
+    assert registry._endpoints is cached_endpoints
+
+    @app.get("/orders")
+    async def list_orders():
+        return []
+
+    app.openapi_schema = None
+    assert [endpoint.id for endpoint in registry.list_endpoints()] == [
+        "GET /items",
+        "GET /orders",
+    ]
+
+
+def test_list_endpoints_skips_openapi_when_routes_unchanged():
+    """Steady-state listing should not regenerate or even fetch the schema."""
+    app = FastAPI()
+
+    @app.get("/items")
+    async def list_items():
+        return []
+
+    registry = PulseEndpointRegistry(app)
+    registry.list_endpoints()
+
+    calls = []
+    original_openapi = app.openapi
+
+    def counting_openapi():
+        calls.append(1)
+        return original_openapi()
+
+    app.openapi = counting_openapi
+    registry.list_endpoints()
+    registry.get_endpoint_map()
+    registry.auto_probe_targets()
+    assert registry.openapi_schema["paths"]
+    assert calls == []
+
+    @app.get("/orders")
+    async def list_orders():
+        return []
+
+    app.openapi_schema = None
+    assert len(registry.list_endpoints()) == 2
+    assert calls == [1]
+
+
+def test_endpoint_to_dict_exposes_all_fields():
+    """to_dict mirrors every EndpointInfo field without sharing the tag list."""
+    app = FastAPI()
+
+    @app.get("/items/{item_id}", tags=["items"])
+    async def get_item(item_id: int):
+        return {}
+
+    endpoint = PulseEndpointRegistry(app).list_endpoints()[0]
+    data = endpoint.to_dict()
+
+    assert set(data) == set(EndpointInfo.__dataclass_fields__)
+    assert data["tags"] == ["items"] and data["tags"] is not endpoint.tags
+    assert data["path_parameters"][0]["name"] == "item_id"
+
+
+def test_auto_probe_targets_skip_endpoints_requiring_input():
+    """Endpoints with required parameters are not auto-probed."""
+    app = FastAPI()
+
+    @app.get("/items")
+    async def list_items():
+        return []
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {}
+
+    registry = PulseEndpointRegistry(app)
+    assert [endpoint.id for endpoint in registry.auto_probe_targets()] == ["GET /items"]